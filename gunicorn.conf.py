@@ -0,0 +1,21 @@
+# Gunicorn configuration for LoxIO Core API
+#
+# Usage: gunicorn -c gunicorn.conf.py main:app
+#
+# GPIO lines are claimed exclusively by the process that requests them (a
+# second request returns EBUSY), and edge events, the output state cache and
+# the parsed config live in process memory. Only ONE worker may therefore run
+# the app. Concurrency comes from the asyncio event loop: blocking work is
+# kept off the loop, so a single worker serves requests concurrently.
+import os
+
+bind = f"0.0.0.0:{os.environ.get('LOXIO_API_PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = 1
+
+# Do not preload: GPIO lines must be requested inside the worker (lifespan)
+preload_app = False
+
+# Match the systemd TimeoutStopSec so lines are released cleanly on restart
+graceful_timeout = 10
+timeout = 30
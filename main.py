@@ -1,35 +1,56 @@
 import json
+import csv
+import orjson
 import gpiod
 import os
 import asyncio
 from datetime import timedelta
 from fastapi import FastAPI, HTTPException, Request, File, UploadFile
-from fastapi.responses import PlainTextResponse, Response
-from pydantic import BaseModel
-from typing import List, Dict, Optional
+from fastapi.responses import PlainTextResponse, Response, ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, ValidationError, field_validator
+from typing import List, Dict, Literal, Optional, Union
 from gpiod.line import Direction, Value, Edge, Bias
 import platform
 import socket
+import fcntl
+import struct
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from xml.sax.saxutils import escape
 from fastapi.staticfiles import StaticFiles
 import subprocess
 import time
 import shutil
 from collections import deque
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import queue
+import atexit
 
 # =============================================================================
 # CONFIGURATION CONSTANTS
 # =============================================================================
 STATS_COLLECT_INTERVAL_SEC = 10          # How often to collect system stats
 STATS_HISTORY_MAX_POINTS = 360           # Max history points (360 * 10s = 1 hour)
-INTERRUPT_POLL_INTERVAL_SEC = 0.1        # GPIO interrupt polling interval
-INTERRUPT_EDGE_TIMEOUT_SEC = 0.01        # Edge event wait timeout
 EVENT_QUEUE_MAX_SIZE = 1000              # Max queued GPIO events
+EVENTS_MAX_WAIT_SEC = 30                 # Upper bound for /events?wait= long polling
 LOG_MAX_BYTES = 1 * 1024 * 1024          # 1MB per log file
 LOG_BACKUP_COUNT = 5                     # Number of log file backups
 TASK_HEALTH_CHECK_INTERVAL_SEC = 30      # Background task health check interval
+LOG_TAIL_CHUNK_BYTES = 8192              # Block size when reading the log backwards
+UPLOAD_COPY_CHUNK_BYTES = 1 << 16        # Block size when saving an uploaded update ZIP
+IP_CACHE_TTL_SEC = 30                    # How long the detected local IP is reused
+UPDATE_CHECK_TTL_SEC = 60                # How long a successful /update/check result is reused
+PIN_SLOTS = 64                           # Header pin numbers index flat per-pin tables
+DEFAULT_DEBOUNCE_MS = 5                  # Edges closer together than this are ignored (per pin "debounce_ms")
+
+# Lookup tables for hot-path value conversions
+VALUE_TO_INT = {Value.ACTIVE: 1, Value.INACTIVE: 0}
+INT_TO_VALUE = {1: Value.ACTIVE, 0: Value.INACTIVE}
+EDGE_EVENT_NAMES = {
+    gpiod.EdgeEvent.Type.RISING_EDGE: "Rising",
+    gpiod.EdgeEvent.Type.FALLING_EDGE: "Falling",
+}
 
 # =============================================================================
 # GLOBAL STATE
@@ -39,34 +60,98 @@ TASK_HEALTH_CHECK_INTERVAL_SEC = 30      # Background task health check interval
 line_requests = {}
 # Mapping: pin_num -> (chip_path, line_offset)
 pin_mapping = {}
-# Reverse mapping for efficient lookup: (chip_path, line_offset) -> pin_num
+# Reverse mapping per chip, so edge events resolve with a plain int key: chip_path -> {line_offset: pin_num}
 reverse_pin_mapping = {}
+# One shared request per chip for all of its lines: chip_path -> gpiod.LineRequest
+chip_requests = {}
+# Hardware settings each chip request was made with, so a reload can tell which
+# chips actually changed: chip_path -> {line_offset: (Direction, Bias)}
+chip_specs = {}
+# Subset of chip_requests that contain input lines (edge detection enabled)
+input_requests = {}
+# Output line offsets per chip for bulk writes: chip_path -> [line_offset, ...]
+output_offsets = {}
+# Flat per-pin tables indexed by pin_num for the set/toggle hot path
+pin_to_req = [None] * PIN_SLOTS          # pin_num -> gpiod.LineRequest or None
+pin_to_offset = [-1] * PIN_SLOTS         # pin_num -> line offset
+# Last value written to each output pin (this API is the only writer):
+# pin_num -> gpiod.line.Value, None for inputs / unclaimed pins
+output_state = [None] * PIN_SLOTS
+# Software debounce for input pins: pin_num -> window in ns / timestamp of last accepted edge
+pin_debounce_ns = [0] * PIN_SLOTS
+last_edge_ns = [0] * PIN_SLOTS
+# Parsed contents of CONFIG_FILE, re-read only when the file's mtime changes
+gpio_config = None
+config_mtime = None
+# Precomputed /pins/status rows: [(row, (chip_path, line_offset) or None), ...]
+# Each row is a prebuilt response dict; only "current_state" changes per request.
+status_plan = []
+status_rows = []
+# Precomputed /loxone/status lines for every configured pin: [(b"Pin <num>=", (chip_path, line_offset) or None), ...]
+# Every prefix after the first carries the preceding newline, so the body is just prefix + value bytes.
+loxone_plan = []
+# File descriptors registered with the event loop for edge events: fd -> chip_path
+interrupt_fds = {}
+# Serialized "/" response, rebuilt lazily after the pin mapping changes
+root_body = None
+# /proc and /sys files kept open for repeated sampling: path -> fd
+pseudo_file_fds = {}
 
 CONFIG_FILE = "gpio_config.json"
 DEFAULT_CONFIG_FILE = "gpio_config.default.json"  # Template config (tracked in git)
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 SCRIPTS_DIR = os.path.join(APP_DIR, "scripts")
 LOG_FILE = os.path.join(APP_DIR, "app.log")
+API_DESCRIPTION_FILE = os.path.join(APP_DIR, "api_description.md")
+CPU_TEMP_FILE = "/sys/class/thermal/thermal_zone0/temp"
 
 # Setup Structured Logging
+# LOXIO_LOG_LEVEL=WARNING silences the per-edge INFO records on busy inputs
+LOG_LEVEL = os.environ.get("LOXIO_LOG_LEVEL", "INFO").upper()
 logger = logging.getLogger("LoxIO")
-logger.setLevel(logging.INFO)
+logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 
 # Rotating handler with configurable size and backup count
 file_handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
 file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
 
 # Also log to console for development
 stream_handler = logging.StreamHandler()
 stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
+
+# Handlers run on a listener thread; the event loop only enqueues records,
+# so logging an edge event never blocks on file or console I/O.
+log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, file_handler, stream_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 class PinState(BaseModel):
     pin_num: int
     state: int  # 0 or 1
 
+class PinConfig(BaseModel):
+    """One entry of the "pins" list in gpio_config.json (extra keys such as "name" are allowed)."""
+    model_config = ConfigDict(extra="allow")
+
+    num: StrictInt = Field(ge=0, lt=PIN_SLOTS)
+    chip: StrictInt
+    line: StrictInt
+    direction: Literal["input", "output", "disabled"]
+    bias: Literal["none", "pull-up", "pull-down", "disabled"]
+    debounce_ms: Union[StrictInt, StrictFloat] = Field(DEFAULT_DEBOUNCE_MS, ge=0)
+
+    @field_validator("direction", "bias", mode="before")
+    @classmethod
+    def lowercase(cls, value):
+        # Values are matched case-insensitively, as init_gpios does
+        return value.lower() if isinstance(value, str) else value
+
+class BatchSet(BaseModel):
+    updates: List[PinState]
+
 class WifiConnect(BaseModel):
     ssid: str
     password: str
@@ -78,35 +163,38 @@ class EthernetConfig(BaseModel):
     dns: Optional[str] = None
 
 # Background task info
-interrupt_task = None
 stats_task = None
 task_monitor_task = None
-event_queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAX_SIZE)
+# Ring buffer of recent edge events; appending to a full deque drops the oldest
+event_queue = deque(maxlen=EVENT_QUEUE_MAX_SIZE)
+# Set whenever event_queue is non-empty; wakes /events long-poll requests
+events_available = asyncio.Event()
+# Number of events discarded because nobody drained /events in time
+dropped_events = 0
 # Circular buffer for stats: [(timestamp, cpu_temp, load_1m), ...]
 stats_history = deque(maxlen=STATS_HISTORY_MAX_POINTS)
+# Latest get_system_info() result, refreshed by monitor_stats every STATS_COLLECT_INTERVAL_SEC
+system_info_snapshot = None
 
 async def monitor_stats():
     """Background task to collect system stats periodically."""
+    global system_info_snapshot
     logger.info("Stats monitor: Task started")
     while True:
         try:
             # CPU temperature
             cpu_temp = 0.0
-            if os.path.exists("/sys/class/thermal/thermal_zone0/temp"):
-                try:
-                    with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-                        cpu_temp = int(f.read().strip()) / 1000.0
-                except (IOError, ValueError) as e:
-                    logger.warning(f"Failed to read CPU temperature: {e}")
+            try:
+                cpu_temp = read_cpu_temp() or 0.0
+            except (IOError, ValueError) as e:
+                logger.warning(f"Failed to read CPU temperature: {e}")
+
+            # System info snapshot served by /health and /loxone/stats
+            system_info_snapshot = get_system_info()
 
             # Load Average
-            load_1m = 0.0
-            if os.path.exists("/proc/loadavg"):
-                try:
-                    with open("/proc/loadavg", "r") as f:
-                        load_1m = float(f.read().split()[0])
-                except (IOError, ValueError) as e:
-                    logger.warning(f"Failed to read load average: {e}")
+            load_avg = system_info_snapshot["load_avg"]
+            load_1m = load_avg[0] if load_avg else 0.0
 
             # Timestamp (Local time as ISO string for frontend)
             current_time = time.strftime("%H:%M:%S")
@@ -122,50 +210,83 @@ async def monitor_stats():
 
         await asyncio.sleep(STATS_COLLECT_INTERVAL_SEC)
 
-async def monitor_interrupts():
-    """Background task to poll for GPIO edge events."""
-    logger.info("Interrupt monitor: Task started")
-    while True:
+def stop_chip_reader(chip_path):
+    """Unregister the edge event fds of one chip from the event loop."""
+    for fd, path in list(interrupt_fds.items()):
+        if path == chip_path:
+            asyncio.get_running_loop().remove_reader(fd)
+            del interrupt_fds[fd]
+
+def _drain_edge_events(chip_path, req):
+    """Event loop reader callback: queue all pending edge events of a chip request."""
+    global dropped_events
+    # Only edge-enabled requests are registered, so no per-call capability checks
+    try:
+        # The fd is readable, so this returns immediately
+        events = req.read_edge_events()
+    except gpiod.RequestReleasedError:
+        # Stop watching a dead fd instead of being woken for it again
+        logger.debug(f"Request on {chip_path} was released, removing reader")
+        stop_chip_reader(chip_path)
+        return
+    except OSError as e:
+        logger.warning(f"I/O error reading edge events on {chip_path}: {e}")
+        return
+    except Exception as e:
+        # The fd stays readable, so an unhandled error would re-fire on every loop iteration
+        logger.error(f"Unexpected error reading edge events on {chip_path}, removing reader: {e}", exc_info=True)
+        stop_chip_reader(chip_path)
+        return
+
+    # Resolve the chip's offset table once for the whole batch
+    offset_pins = reverse_pin_mapping.get(chip_path, {})
+    batch = []
+    for event in events:
+        pin_num = offset_pins.get(event.line_offset, "unknown")
+        if pin_num != "unknown":
+            # Collapse contact bounce into a single event
+            if event.timestamp_ns - last_edge_ns[pin_num] < pin_debounce_ns[pin_num]:
+                continue
+            last_edge_ns[pin_num] = event.timestamp_ns
+        event_type = EDGE_EVENT_NAMES.get(event.event_type, "Unknown")
+        # Lazy %-formatting: nothing is built when INFO is disabled
+        logger.info("Interrupt on Pin %s: %s", pin_num, event_type)
+
+        batch.append({
+            "pin": pin_num,
+            "event": event_type,
+            # Kernel monotonic timestamp of the edge, as a plain integer
+            "timestamp_ns": event.timestamp_ns
+        })
+
+    if not batch:
+        return
+    # When full, the deque drops the oldest events so /events always reports the latest activity
+    overflow = len(event_queue) + len(batch) - EVENT_QUEUE_MAX_SIZE
+    if overflow > 0:
+        dropped_events += overflow
+        logger.warning(f"Event queue full, dropped {overflow} oldest event(s)")
+    event_queue.extend(batch)
+    events_available.set()
+
+def start_interrupt_readers():
+    """Register every input request fd with the event loop for edge-driven delivery."""
+    loop = asyncio.get_running_loop()
+    for chip_path, req in input_requests.items():
         try:
-            for (chip_path, line_offset), req in line_requests.items():
-                # We only check for events on lines that were requested with edge detection
-                # In this app, we requested ALL inputs with edge detection
-                try:
-                    # Use a very short timeout to avoid blocking the event loop
-                    if req.wait_edge_events(timeout=INTERRUPT_EDGE_TIMEOUT_SEC):
-                        events = req.read_edge_events()
-                        for event in events:
-                            # Use reverse mapping for efficient lookup
-                            pin_num = reverse_pin_mapping.get((chip_path, line_offset), "unknown")
-                            event_type = "Rising" if event.event_type == Edge.RISING else "Falling"
-                            logger.info(f"Interrupt on Pin {pin_num}: {event_type}")
-
-                            # Handle full queue gracefully
-                            try:
-                                event_queue.put_nowait({
-                                    "pin": pin_num,
-                                    "event": event_type,
-                                    "timestamp": str(event.timestamp_ns)
-                                })
-                            except asyncio.QueueFull:
-                                logger.warning(f"Event queue full, dropping event for Pin {pin_num}")
-                except gpiod.RequestReleasedError:
-                    # Line was released, skip it
-                    logger.debug(f"Line {chip_path}:{line_offset} was released, skipping")
-                except OSError as e:
-                    # Hardware I/O error on this specific line
-                    logger.debug(f"I/O error on {chip_path}:{line_offset}: {e}")
-                except Exception as e:
-                    # Log unexpected errors for debugging (not all lines support events)
-                    logger.debug(f"Edge event check failed for {chip_path}:{line_offset}: {e}")
-
-            await asyncio.sleep(INTERRUPT_POLL_INTERVAL_SEC)
-        except asyncio.CancelledError:
-            logger.info("Interrupt monitor: Task cancelled")
-            break
+            fd = req.fd
+            loop.add_reader(fd, _drain_edge_events, chip_path, req)
+            interrupt_fds[fd] = chip_path
         except Exception as e:
-            logger.error(f"Interrupt monitor error: {e}", exc_info=True)
-            await asyncio.sleep(1)
+            logger.error(f"Failed to watch edge events on {chip_path}: {e}")
+    logger.info(f"Interrupt readers: Watching {len(interrupt_fds)} chip request(s)")
+
+def stop_interrupt_readers():
+    """Unregister all edge event fds from the event loop."""
+    loop = asyncio.get_running_loop()
+    for fd in interrupt_fds:
+        loop.remove_reader(fd)
+    interrupt_fds.clear()
 
 def validate_gpio_config(config: Dict) -> bool:
     """Validate the GPIO configuration for logical errors and duplicates."""
@@ -174,54 +295,64 @@ def validate_gpio_config(config: Dict) -> bool:
     
     seen_nums = set()
     seen_hardware = set()
-    valid_directions = ["input", "output", "disabled"]
-    valid_biases = ["none", "pull-up", "pull-down", "disabled"]
-
-    for pin in config["pins"]:
-        # Required fields
-        for field in ["num", "chip", "line", "direction", "bias"]:
-            if field not in pin:
-                raise ValueError(f"Pin {pin.get('num', 'unknown')} is missing required field: {field}")
 
-        # Type checks
-        if not isinstance(pin["num"], int) or not isinstance(pin["chip"], int) or not isinstance(pin["line"], int):
-            raise ValueError(f"Pin {pin['num']} chip/line/num must be integers.")
+    for raw_pin in config["pins"]:
+        # Required fields, types and allowed values are checked by the model in one pass
+        try:
+            pin = PinConfig.model_validate(raw_pin)
+        except ValidationError as e:
+            err = e.errors()[0]
+            pin_num = raw_pin.get("num", "unknown") if isinstance(raw_pin, dict) else "unknown"
+            field = err["loc"][0] if err["loc"] else "entry"
+            raise ValueError(f"Pin {pin_num} has invalid {field}: {err['msg']}")
 
         # Duplicate checks
-        if pin["num"] in seen_nums:
-            raise ValueError(f"Duplicate Pin number detected: {pin['num']}")
-        seen_nums.add(pin["num"])
+        if pin.num in seen_nums:
+            raise ValueError(f"Duplicate Pin number detected: {pin.num}")
+        seen_nums.add(pin.num)
 
-        hw_key = (pin["chip"], pin["line"])
+        hw_key = (pin.chip, pin.line)
         if hw_key in seen_hardware:
-            raise ValueError(f"Duplicate hardware mapping detected: Chip {pin['chip']}, Line {pin['line']}")
+            raise ValueError(f"Duplicate hardware mapping detected: Chip {pin.chip}, Line {pin.line}")
         seen_hardware.add(hw_key)
 
-        # Value checks
-        if pin["direction"].lower() not in valid_directions:
-            raise ValueError(f"Invalid direction for Pin {pin['num']}: {pin['direction']}")
-        if pin["bias"].lower() not in valid_biases:
-            raise ValueError(f"Invalid bias for Pin {pin['num']}: {pin['bias']}")
-
     return True
 
-def release_gpios():
-    """Release all claimed GPIO lines and stop background tasks."""
-    logger.info("Releasing all GPIO lines...")
-    global interrupt_task
-    if interrupt_task:
-        interrupt_task.cancel()
-
-    for key, req in line_requests.items():
+def release_requests(requests: Dict):
+    """Release the given chip requests: chip_path -> gpiod.LineRequest."""
+    for chip_path, req in requests.items():
         try:
             req.release()
-            logger.debug(f"Released line {key}")
+            logger.debug(f"Released lines on {chip_path}")
         except Exception as e:
-            logger.error(f"Error releasing line {key}: {e}")
+            logger.error(f"Error releasing lines on {chip_path}: {e}")
+
+def release_gpios():
+    """Release all claimed GPIO lines and stop edge event readers."""
+    logger.info("Releasing all GPIO lines...")
+    stop_interrupt_readers()
+    release_requests(chip_requests)
+    reset_gpio_tables()
 
+def reset_gpio_tables():
+    """Forget all claimed lines and the tables derived from them (releases nothing)."""
+    global root_body
     line_requests.clear()
+    chip_requests.clear()
+    chip_specs.clear()
+    input_requests.clear()
+    output_offsets.clear()
+    pin_to_req[:] = [None] * PIN_SLOTS
+    pin_to_offset[:] = [-1] * PIN_SLOTS
+    output_state[:] = [None] * PIN_SLOTS
+    pin_debounce_ns[:] = [0] * PIN_SLOTS
+    last_edge_ns[:] = [0] * PIN_SLOTS
+    status_plan.clear()
+    status_rows.clear()
+    loxone_plan.clear()
     pin_mapping.clear()
     reverse_pin_mapping.clear()
+    root_body = None
 
 def ensure_config_exists():
     """Ensure user config exists, copy from default template if missing."""
@@ -238,39 +369,126 @@ def ensure_config_exists():
     return True
 
 
-def init_gpios():
-    """Initialise GPIOs based on config file."""
-    logger.info("Initialising GPIOs...")
-
+def read_config_file() -> Dict:
+    """Parse CONFIG_FILE from disk without touching the in-memory copy."""
+    with open(CONFIG_FILE, "rb") as f:
+        return orjson.loads(f.read())
+
+def write_config_file(config: Dict) -> None:
+    """Atomically replace CONFIG_FILE: a crash mid-write never leaves a truncated config."""
+    tmp_path = CONFIG_FILE + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, CONFIG_FILE)
+
+def reload_config() -> Dict:
+    """Read CONFIG_FILE from disk and replace the in-memory copy.
+
+    The cache is only updated after a successful parse, so a broken edit keeps
+    serving the last good config.
+    """
+    global gpio_config, config_mtime
+    # Nanosecond mtime: two saves within the same second are still told apart
+    mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    config = read_config_file()
+    gpio_config, config_mtime = config, mtime
+    return gpio_config
+
+def load_config() -> Dict:
+    """Return the in-memory GPIO config; a single stat detects edits to CONFIG_FILE."""
+    if gpio_config is None or os.stat(CONFIG_FILE).st_mtime_ns != config_mtime:
+        return reload_config()
+    return gpio_config
+
+def read_startup_config() -> Optional[Dict]:
+    """Load the config for init_gpios, creating it from the default if needed; None on failure."""
     # Ensure config file exists (copy from default if needed)
     if not ensure_config_exists():
-        return
+        return None
 
     if not os.path.exists(CONFIG_FILE):
         logger.error(f"Error: {CONFIG_FILE} not found.")
-        return
+        return None
 
     try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
+        return reload_config()
     except Exception as e:
         logger.error(f"Error loading config: {e}")
+        return None
+
+def request_chip_lines(chip_path: str, chip_config: Dict):
+    """Request all lines of a chip at once: returns (request, config of the claimed lines).
+
+    If the grouped request fails, each line is probed on its own and the lines
+    that cannot be claimed (busy, bad offset) are dropped, so one bad line does
+    not take the rest of the bank offline.
+    """
+    try:
+        return gpiod.request_lines(chip_path, consumer="fastapi-gpio", config=chip_config), chip_config
+    except Exception as e:
+        group_error = e
+
+    offset_pins = reverse_pin_mapping.get(chip_path, {})
+    usable = {}
+    for line_offset, settings in chip_config.items():
+        try:
+            gpiod.request_lines(chip_path, consumer="fastapi-gpio", config={line_offset: settings}).release()
+            usable[line_offset] = settings
+        except Exception as e:
+            logger.error(f"Failed to request Pin {offset_pins.get(line_offset)} (line {line_offset}) on {chip_path}, skipping: {e}")
+    # Nothing to drop (or nothing left): the grouped failure was not caused by a single line
+    if not usable or len(usable) == len(chip_config):
+        raise group_error
+    return gpiod.request_lines(chip_path, consumer="fastapi-gpio", config=usable), usable
+
+def init_gpios(previous=None):
+    """Initialise GPIOs based on config file.
+
+    previous carries the requests of the running config as
+    (chip_requests, chip_specs, {(chip_path, line_offset): output Value}).
+    A chip with identical settings keeps its request, one with the same lines
+    is reconfigured in place, and any other leftover request is released.
+    Outputs that stay outputs keep their level either way.
+    """
+    logger.info("Initialising GPIOs...")
+    prev_requests, prev_specs, prev_outputs = previous or ({}, {}, {})
+
+    config = read_startup_config()
+    if config is None:
+        release_requests(prev_requests)
         return
 
+    # All lines of a chip are grouped into a single request so bulk reads,
+    # bulk writes and edge events cost one ioctl per chip: chip_path -> {offset: settings}
+    chip_configs = {}
+    chip_pins = {}
+    new_specs = {}
+
     for pin_cfg in config.get("pins", []):
         pin_num = pin_cfg.get("num")
         direction_str = pin_cfg.get("direction", "output").lower()
         if direction_str == "disabled":
             logger.info(f"Pin {pin_num} is disabled, skipping hardware initialization.")
             continue
+        if not isinstance(pin_num, int) or not 0 <= pin_num < PIN_SLOTS:
+            logger.error(f"Pin {pin_num} is not a valid pin number, skipping.")
+            continue
 
         chip_num = pin_cfg.get("chip")
         line_offset = pin_cfg.get("line")
         bias_str = pin_cfg.get("bias", "none").lower()
         chip_path = f"/dev/gpiochip{chip_num}"
 
+        # In a chip-wide request a second entry would silently replace the first
+        owner = reverse_pin_mapping.get(chip_path, {}).get(line_offset)
+        if owner is not None:
+            logger.error(f"Pin {pin_num} uses Chip {chip_num}, Line {line_offset} already claimed by Pin {owner}, skipping.")
+            continue
+
         pin_mapping[pin_num] = (chip_path, line_offset)
-        reverse_pin_mapping[(chip_path, line_offset)] = pin_num
+        reverse_pin_mapping.setdefault(chip_path, {})[line_offset] = pin_num
         
         # Mapping configuration
         dir_val = Direction.OUTPUT if direction_str == "output" else Direction.INPUT
@@ -294,39 +512,118 @@ def init_gpios():
             )
             
             if dir_val == Direction.OUTPUT:
-                settings.output_value = Value.INACTIVE
+                settings.output_value = prev_outputs.get((chip_path, line_offset), Value.INACTIVE)
 
-            req = gpiod.request_lines(
-                chip_path,
-                consumer=f"fastapi-pin-{pin_num}",
-                config={line_offset: settings}
-            )
-            line_requests[(chip_path, line_offset)] = req
-            logger.info(f"Successfully requested Pin {pin_num} ({direction_str}) on {chip_path}")
+            chip_configs.setdefault(chip_path, {})[line_offset] = settings
+            new_specs.setdefault(chip_path, {})[line_offset] = (dir_val, bias_val)
+            chip_pins.setdefault(chip_path, []).append((pin_num, dir_val))
+            if dir_val == Direction.INPUT:
+                pin_debounce_ns[pin_num] = int(pin_cfg.get("debounce_ms", DEFAULT_DEBOUNCE_MS) * 1_000_000)
         except Exception as e:
-            msg = f"Failed to request Pin {pin_num} ({direction_str}) on {chip_path}: {e}"
+            msg = f"Failed to configure Pin {pin_num} ({direction_str}) on {chip_path}: {e}"
             logger.error(msg)
 
+    for chip_path, chip_config in chip_configs.items():
+        pins = [pin_num for pin_num, _ in chip_pins[chip_path]]
+        spec = new_specs[chip_path]
+        req = prev_requests.pop(chip_path, None)
+        prev_spec = prev_specs.get(chip_path)
+        # A request's line set is fixed, so adding or removing lines needs a new one
+        if req is not None and prev_spec != spec and prev_spec.keys() != spec.keys():
+            release_requests({chip_path: req})
+            req = None
+        if req is not None and prev_spec != spec:
+            try:
+                req.reconfigure_lines(chip_config)
+            except Exception as e:
+                logger.warning(f"Failed to reconfigure Pins {pins} on {chip_path}, requesting them again: {e}")
+                release_requests({chip_path: req})
+                req = None
+        if req is None:
+            try:
+                req, chip_config = request_chip_lines(chip_path, chip_config)
+            except Exception as e:
+                logger.error(f"Failed to request Pins {pins} on {chip_path}: {e}")
+                continue
+
+        # Lines dropped by request_chip_lines stay unclaimed (reported inactive)
+        chip_pin_dirs = [(pin_num, dir_val) for pin_num, dir_val in chip_pins[chip_path]
+                         if pin_mapping[pin_num][1] in chip_config]
+        pins = [pin_num for pin_num, _ in chip_pin_dirs]
+        chip_requests[chip_path] = req
+        chip_specs[chip_path] = {line_offset: spec[line_offset] for line_offset in chip_config}
+        for line_offset in chip_config:
+            line_requests[(chip_path, line_offset)] = req
+        for pin_num, dir_val in chip_pin_dirs:
+            line_offset = pin_mapping[pin_num][1]
+            pin_to_req[pin_num] = req
+            pin_to_offset[pin_num] = line_offset
+            if dir_val == Direction.INPUT:
+                input_requests[chip_path] = req
+            else:
+                output_offsets.setdefault(chip_path, []).append(line_offset)
+                output_state[pin_num] = chip_config[line_offset].output_value
+        logger.info(f"Successfully requested Pins {pins} on {chip_path}")
+
+    # Chips that no longer have any configured line
+    release_requests(prev_requests)
+    build_status_plan(config)
+
+def build_status_plan(config: Dict):
+    """Build the /pins/status rows and /loxone/status lines and resolve their claimed lines once."""
+    status_plan.clear()
+    status_rows.clear()
+    loxone_plan.clear()
+    for pin_cfg in config.get("pins", []):
+        if pin_cfg.get("direction") == "disabled":
+            continue
+        mapping = pin_mapping.get(pin_cfg["num"])
+        if mapping not in line_requests:
+            mapping = None
+        row = {**pin_cfg, "active": mapping is not None, "current_state": -1}
+        status_plan.append((row, mapping))
+        status_rows.append(row)
+
+    # Loxone lists every configured pin, disabled ones report 0
+    for pin_cfg in config.get("pins", []):
+        mapping = pin_mapping.get(pin_cfg["num"])
+        prefix = f"Pin {pin_cfg['num']}=".encode()
+        if loxone_plan:
+            prefix = b"\n" + prefix
+        loxone_plan.append((prefix, mapping if mapping in line_requests else None))
+
+def read_line_values() -> Dict:
+    """Read every claimed line with one get_values call per chip: (chip_path, line_offset) -> Value."""
+    values = {}
+    for chip_path, req in chip_requests.items():
+        try:
+            for line_offset, val in zip(req.offsets, req.get_values()):
+                values[(chip_path, line_offset)] = val
+        except Exception as e:
+            logger.debug(f"Could not read values on {chip_path}: {e}")
+    return values
+
+def reload_gpios():
+    """Re-initialise GPIOs from the config file, re-requesting only chips whose lines changed."""
+    stop_interrupt_readers()
+    previous = (
+        dict(chip_requests),
+        dict(chip_specs),
+        {pin_mapping[pin_num]: val for pin_num, val in enumerate(output_state) if val is not None},
+    )
+    reset_gpio_tables()
+    init_gpios(previous)
+    start_interrupt_readers()
+
 async def monitor_task_health():
     """Background task to monitor and restart failed background tasks."""
-    global interrupt_task, stats_task
+    global stats_task
     logger.info("Task health monitor: Started")
 
     while True:
         try:
             await asyncio.sleep(TASK_HEALTH_CHECK_INTERVAL_SEC)
 
-            # Check interrupt monitor
-            if interrupt_task is None or interrupt_task.done():
-                if interrupt_task and interrupt_task.done():
-                    exc = interrupt_task.exception() if not interrupt_task.cancelled() else None
-                    if exc:
-                        logger.error(f"Interrupt monitor crashed with: {exc}")
-                    else:
-                        logger.warning("Interrupt monitor stopped unexpectedly")
-                logger.info("Restarting interrupt monitor...")
-                interrupt_task = asyncio.create_task(monitor_interrupts())
-
             # Check stats monitor
             if stats_task is None or stats_task.done():
                 if stats_task and stats_task.done():
@@ -346,13 +643,38 @@ async def monitor_task_health():
             await asyncio.sleep(5)
 
 
+def apply_scheduling_settings():
+    """Opt-in real-time scheduling to cut edge event jitter under load.
+
+    LOXIO_RT_PRIORITY=<1-99> switches the process to SCHED_FIFO and
+    LOXIO_CPU_AFFINITY=<cpu[,cpu...]> pins it to those cores. Both need
+    CAP_SYS_NICE (the service runs as root); failures are logged and ignored.
+    """
+    priority = os.environ.get("LOXIO_RT_PRIORITY")
+    if priority:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(int(priority)))
+            logger.info(f"Using SCHED_FIFO with priority {priority}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not set real-time priority {priority}: {e}")
+
+    affinity = os.environ.get("LOXIO_CPU_AFFINITY")
+    if affinity:
+        try:
+            cpus = {int(cpu) for cpu in affinity.split(",")}
+            os.sched_setaffinity(0, cpus)
+            logger.info(f"Pinned to CPUs {sorted(cpus)}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not set CPU affinity {affinity}: {e}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global interrupt_task, stats_task, task_monitor_task
+    global stats_task, task_monitor_task
     # Startup
     logger.info("Starting LoxIO Core API...")
+    apply_scheduling_settings()
     init_gpios()
-    interrupt_task = asyncio.create_task(monitor_interrupts())
+    start_interrupt_readers()
     stats_task = asyncio.create_task(monitor_stats())
     task_monitor_task = asyncio.create_task(monitor_task_health())
     logger.info("All background tasks started")
@@ -361,7 +683,7 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down LoxIO Core API...")
 
     # Cancel all background tasks
-    tasks_to_cancel = [interrupt_task, stats_task, task_monitor_task]
+    tasks_to_cancel = [stats_task, task_monitor_task]
     for task in tasks_to_cancel:
         if task:
             task.cancel()
@@ -372,134 +694,160 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
-    # Release GPIO resources
-    for key, req in line_requests.items():
-        try:
-            req.release()
-            logger.debug(f"Released line {key}")
-        except Exception as e:
-            logger.warning(f"Error releasing line {key}: {e}")
-
-    line_requests.clear()
-    pin_mapping.clear()
-    reverse_pin_mapping.clear()
+    # Release GPIO resources (same path as a config reload)
+    release_gpios()
+    close_pseudo_files()
     logger.info("Cleanup complete")
 
 app = FastAPI(
     title="LoxIO Core API",
-    description="""
-**LoxIO Core** is a high-performance GPIO control system by **RS Soft**.
-Designed for Orange Pi Zero 3.
-
-![Orange Pi Zero 3 Pinout](/static/pinout.png)
-
-### Mapping Table (Orange Pi Zero 3 v1.2)
-| Header Pin | Image Label | GPIO Bank | Line Offset |
-| :--- | :--- | :--- | :--- |
-| **Pin 3** | PH5 | PH | **229** |
-| **Pin 5** | PH4 | PH | **228** |
-| **Pin 7** | PC9 | PC | **73** |
-| **Pin 11** | PC6 | PC | **70** |
-| **Pin 12** | PC11 | PC | **75** |
-| **Pin 13** | PC5 | PC | **69** |
-| **Pin 15** | PC8 | PC | **72** |
-| **Pin 16** | PC15 | PC | **79** |
-| **Pin 18** | PC14 | PC | **78** |
-| **Pin 19** | PH7 | PH | **231** |
-| **Pin 21** | PH8 | PH | **232** |
-| **Pin 22** | PC7 | PC | **71** |
-| **Pin 23** | PH6 | PH | **230** |
-| **Pin 24** | PH9 | PH | **233** |
-| **Pin 26** | PC10 | PC | **74** |
-    """,
+    # Full markdown (pinout table) is loaded lazily, see custom_openapi()
+    description="LoxIO Core GPIO control API for Orange Pi Zero 3 by RS Soft.",
     version="1.2.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+def load_api_description() -> str:
+    """Read the OpenAPI markdown description once, on the first schema request."""
+    try:
+        with open(API_DESCRIPTION_FILE, "r") as f:
+            return f.read()
+    except OSError as e:
+        logger.debug(f"Could not read API description: {e}")
+        return app.description
+
+def custom_openapi():
+    """Generate the OpenAPI schema with the full description only when /docs is used."""
+    if app.openapi_schema is None:
+        app.description = load_api_description()
+    return FastAPI.openapi(app)
+
+app.openapi = custom_openapi
+
 app.mount("/static", StaticFiles(directory=APP_DIR), name="static")
 
 @app.get("/")
 async def root():
-    return {
-        "message": "LoxIO Core API with Input/Interrupt Support",
-        "active_pins": list(pin_mapping.keys())
+    global root_body
+    if root_body is None:
+        root_body = orjson.dumps({
+            "message": "LoxIO Core API with Input/Interrupt Support",
+            "active_pins": list(pin_mapping.keys())
+        })
+    return Response(content=root_body, media_type="application/json")
+
+MEMINFO_KEYS = (b"MemTotal:", b"MemFree:", b"Buffers:", b"Cached:")
+
+def meminfo_value(data: bytes, key: bytes) -> int:
+    """Extract one kB value from raw /proc/meminfo bytes without parsing every line."""
+    # Match at line start so "Cached:" does not hit "SwapCached:"
+    if data.startswith(key):
+        start = 0
+    else:
+        start = data.find(b"\n" + key)
+        if start == -1:
+            return 0
+        start += 1
+    end = data.find(b"\n", start)
+    return int(data[start + len(key):end if end != -1 else None].split()[0])
+
+def get_uptime_seconds() -> float:
+    """Seconds since boot, including time spent suspended (same as /proc/uptime)."""
+    return time.clock_gettime(time.CLOCK_BOOTTIME)
+
+@lru_cache(maxsize=1)
+def get_static_system_info() -> Dict:
+    """Board, OS, kernel and architecture; these cannot change while the process runs."""
+    info = {
+        "board": "unknown",
+        "os": "unknown",
+        "kernel": platform.release(),
+        "arch": platform.machine()
     }
 
+    # Board Info (open directly: a missing file is just another failed read)
+    try:
+        with open("/etc/armbian-release", "r") as f:
+            for line in f:
+                if line.startswith("BOARD_NAME="):
+                    info["board"] = line.split("=")[1].strip().strip('"')
+                    break
+    except (IOError, IndexError) as e:
+        logger.debug(f"Could not read board info: {e}")
+
+    # OS Info
+    try:
+        with open("/etc/os-release", "r") as f:
+            for line in f:
+                if line.startswith("PRETTY_NAME="):
+                    info["os"] = line.split("=")[1].strip().strip('"')
+                    break
+    except (IOError, IndexError) as e:
+        logger.debug(f"Could not read OS info: {e}")
+
+    return info
+
+def read_pseudo_file(path: str, size: int = 4096) -> bytes:
+    """Read a /proc or /sys file through a cached fd: one pread instead of open/read/close."""
+    fd = pseudo_file_fds.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_RDONLY)
+        pseudo_file_fds[path] = fd
+    # These files are regenerated on every read from offset 0
+    return os.pread(fd, size, 0)
+
+def close_pseudo_files():
+    """Close the fds opened by read_pseudo_file."""
+    for fd in pseudo_file_fds.values():
+        os.close(fd)
+    pseudo_file_fds.clear()
+
+def read_cpu_temp() -> Optional[float]:
+    """CPU temperature in degrees C, or None on boards without the thermal zone."""
+    try:
+        return int(read_pseudo_file(CPU_TEMP_FILE, 32)) / 1000.0
+    except FileNotFoundError:
+        return None
+
+def current_system_info() -> Dict:
+    """Latest sampled system info; sampled on demand until the stats task has run."""
+    return system_info_snapshot if system_info_snapshot is not None else get_system_info()
+
 def get_system_info():
     info = {
-        "board": "unknown",
-        "os": "unknown",
+        **get_static_system_info(),
         "hostname": socket.gethostname(),
-        "kernel": platform.release(),
-        "arch": platform.machine(),
         "uptime": "unknown",
         "load_avg": [],
         "ram": {"total": 0, "available": 0, "percent": 0}
         #"disk": {"total": 0, "used": 0, "free": 0, "percent": 0}
     }
 
-    # Board Info
-    if os.path.exists("/etc/armbian-release"):
-        try:
-            with open("/etc/armbian-release", "r") as f:
-                for line in f:
-                    if line.startswith("BOARD_NAME="):
-                        info["board"] = line.split("=")[1].strip().strip('"')
-                        break
-        except (IOError, IndexError) as e:
-            logger.debug(f"Could not read board info: {e}")
-
-    # OS Info
-    if os.path.exists("/etc/os-release"):
-        try:
-            with open("/etc/os-release", "r") as f:
-                for line in f:
-                    if line.startswith("PRETTY_NAME="):
-                        info["os"] = line.split("=")[1].strip().strip('"')
-                        break
-        except (IOError, IndexError) as e:
-            logger.debug(f"Could not read OS info: {e}")
-
-    # Uptime
-    if os.path.exists("/proc/uptime"):
-        try:
-            with open("/proc/uptime", "r") as f:
-                uptime_seconds = float(f.readline().split()[0])
-                info["uptime"] = str(timedelta(seconds=int(uptime_seconds)))
-        except (IOError, ValueError, IndexError) as e:
-            logger.debug(f"Could not read uptime: {e}")
+    # Uptime (CLOCK_BOOTTIME is the clock behind /proc/uptime, read without file I/O)
+    try:
+        info["uptime"] = str(timedelta(seconds=int(get_uptime_seconds())))
+    except OSError as e:
+        logger.debug(f"Could not read uptime: {e}")
 
     # Load Average
-    if os.path.exists("/proc/loadavg"):
-        try:
-            with open("/proc/loadavg", "r") as f:
-                info["load_avg"] = [float(x) for x in f.read().split()[:3]]
-        except (IOError, ValueError) as e:
-            logger.debug(f"Could not read load average: {e}")
+    try:
+        info["load_avg"] = [round(x, 2) for x in os.getloadavg()]
+    except OSError as e:
+        logger.debug(f"Could not read load average: {e}")
 
     # RAM Usage
-    if os.path.exists("/proc/meminfo"):
-        try:
-            mem = {}
-            with open("/proc/meminfo", "r") as f:
-                for line in f:
-                    parts = line.split(":")
-                    if len(parts) == 2:
-                        name = parts[0].strip()
-                        val = int(parts[1].split()[0])
-                        mem[name] = val
-            total = mem.get("MemTotal", 0)
-            free = mem.get("MemFree", 0)
-            buffers = mem.get("Buffers", 0)
-            cached = mem.get("Cached", 0)
-            available = free + buffers + cached
-            info["ram"] = {
-                "total_mb": round(total / 1024, 1),
-                "available_mb": round(available / 1024, 1),
-                "percent": round(100 * (1 - available / total), 1) if total > 0 else 0
-            }
-        except (IOError, ValueError, ZeroDivisionError) as e:
-            logger.debug(f"Could not read memory info: {e}")
+    try:
+        data = read_pseudo_file("/proc/meminfo", 8192)
+        total, free, buffers, cached = (meminfo_value(data, key) for key in MEMINFO_KEYS)
+        available = free + buffers + cached
+        info["ram"] = {
+            "total_mb": round(total / 1024, 1),
+            "available_mb": round(available / 1024, 1),
+            "percent": round(100 * (1 - available / total), 1) if total > 0 else 0
+        }
+    except (IOError, ValueError, ZeroDivisionError) as e:
+        logger.debug(f"Could not read memory info: {e}")
 
     return info
 
@@ -508,13 +856,13 @@ async def health():
     # CPU temperature
     cpu_temp = "unknown"
     try:
-        if os.path.exists("/sys/class/thermal/thermal_zone0/temp"):
-            with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-                cpu_temp = int(f.read().strip()) / 1000.0
+        temp = read_cpu_temp()
+        if temp is not None:
+            cpu_temp = temp
     except (IOError, ValueError) as e:
         logger.debug(f"Could not read CPU temperature: {e}")
 
-    sys_info = get_system_info()
+    sys_info = current_system_info()
 
     return {
         "status": "healthy",
@@ -534,7 +882,8 @@ async def health():
         "gpio_status": {
             "initialized": len(line_requests) > 0,
             "claimed_pins_count": len(line_requests),
-            "interrupt_monitor_running": interrupt_task is not None and not interrupt_task.done()
+            "interrupt_monitor_running": len(interrupt_fds) > 0,
+            "dropped_events": dropped_events
         }
     }
 
@@ -545,43 +894,43 @@ async def get_stats_history():
 
 @app.get("/pins/status")
 async def get_status():
-    status = []
-    if not os.path.exists(CONFIG_FILE):
+    # Rows were built from the config when the lines were claimed; no file access per poll
+    if gpio_config is None:
         raise HTTPException(status_code=404, detail="Config missing")
-    with open(CONFIG_FILE, "r") as f:
-        config = json.load(f)
-    for pin_cfg in config["pins"]:
-        if pin_cfg.get("direction") == "disabled":
-            continue
-            
-        pin_num = pin_cfg["num"]
-        mapping = pin_mapping.get(pin_num)
-        current_val = -1
-        is_active = False
-        
-        if mapping and mapping in line_requests:
-            is_active = True
-            try:
-                val = line_requests[mapping].get_value(mapping[1])
-                current_val = 1 if val == Value.ACTIVE else 0
-            except Exception as e:
-                logger.debug(f"Could not read value for pin {pin_num}: {e}")
-        
-        status.append({
-            **pin_cfg,
-            "active": is_active,
-            "current_state": current_val
-        })
-    return status
+    values = read_line_values()
+    # Rows are reused: only the live value is refreshed before serialization
+    for row, mapping in status_plan:
+        row["current_state"] = VALUE_TO_INT.get(values.get(mapping), -1)
+    return status_rows
+
+# The common idle poll answer, serialized once
+EMPTY_EVENTS_BODY = orjson.dumps({"events": []})
 
 @app.get("/events")
-async def get_events():
-    """Returns all queued interrupt events and clears the queue."""
-    events = []
-    while not event_queue.empty():
-        events.append(event_queue.get_nowait())
+async def get_events(wait: float = 0):
+    """Returns all queued interrupt events and clears the queue.
+
+    With ?wait=<seconds> the request is held until an event arrives (long polling).
+    """
+    if not event_queue and wait > 0:
+        try:
+            await asyncio.wait_for(events_available.wait(), timeout=min(wait, EVENTS_MAX_WAIT_SEC))
+        except asyncio.TimeoutError:
+            pass
+    if not event_queue:
+        return Response(content=EMPTY_EVENTS_BODY, media_type="application/json")
+    events = list(event_queue)
+    event_queue.clear()
+    events_available.clear()
     return {"events": events}
 
+def get_pin_line(pin_num: int):
+    """Return (LineRequest, line_offset) for a claimed pin, or raise 404."""
+    req = pin_to_req[pin_num] if 0 <= pin_num < PIN_SLOTS else None
+    if req is None:
+        raise HTTPException(status_code=404, detail="Pin not active")
+    return req, pin_to_offset[pin_num]
+
 @app.post("/pins/set")
 async def set_pin(request: Request):
     client_ip = request.client.host if request.client else "unknown"
@@ -594,12 +943,12 @@ async def set_pin(request: Request):
             raise HTTPException(status_code=400, detail="Empty body")
 
         try:
-            body_json = json.loads(body_bytes)
-            data = PinState(**body_json)
-        except json.JSONDecodeError as e:
-            logger.warning(f"Invalid JSON from {client_ip} on /pins/set: {e}")
-            raise HTTPException(status_code=422, detail="Invalid JSON format")
-        except Exception as e:
+            # Parse and validate in one pass with pydantic's native JSON parser
+            data = PinState.model_validate_json(body_bytes)
+        except ValidationError as e:
+            if e.errors()[0]["type"] == "json_invalid":
+                logger.warning(f"Invalid JSON from {client_ip} on /pins/set: {e}")
+                raise HTTPException(status_code=422, detail="Invalid JSON format")
             logger.warning(f"Validation error from {client_ip} on /pins/set: {e}")
             raise HTTPException(status_code=422, detail=f"Validation error: {str(e)}")
     except HTTPException:
@@ -608,42 +957,120 @@ async def set_pin(request: Request):
         logger.error(f"Unexpected error parsing request from {client_ip}: {e}")
         raise HTTPException(status_code=422, detail=f"Unprocessable Entity: {str(e)}")
 
-    mapping = pin_mapping.get(data.pin_num)
-    if not mapping or mapping not in line_requests:
-        raise HTTPException(status_code=404, detail="Pin not active")
+    req, line_offset = get_pin_line(data.pin_num)
     
-    val = Value.ACTIVE if data.state == 1 else Value.INACTIVE
+    val = INT_TO_VALUE.get(data.state, Value.INACTIVE)
     try:
-        line_requests[mapping].set_value(mapping[1], val)
+        req.set_value(line_offset, val)
+        output_state[data.pin_num] = val
         return {"pin_num": data.pin_num, "state": data.state, "status": "success"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/pins/toggle/{pin_num}")
 async def toggle_pin(pin_num: int):
-    mapping = pin_mapping.get(pin_num)
-    if not mapping or mapping not in line_requests:
-        raise HTTPException(status_code=404, detail="Pin not active")
+    req, line_offset = get_pin_line(pin_num)
     
     try:
-        current = line_requests[mapping].get_value(mapping[1])
+        # Outputs are only driven by this API, so the cached value saves a read ioctl
+        current = output_state[pin_num]
+        if current is None:
+            current = req.get_value(line_offset)
         new_state = Value.INACTIVE if current == Value.ACTIVE else Value.ACTIVE
-        line_requests[mapping].set_value(mapping[1], new_state)
-        return {"pin_num": pin_num, "state": 1 if new_state == Value.ACTIVE else 0, "status": "toggled"}
+        req.set_value(line_offset, new_state)
+        output_state[pin_num] = new_state
+        return {"pin_num": pin_num, "state": VALUE_TO_INT[new_state], "status": "toggled"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def set_all_outputs(value: Value):
+    """Drive every output line to value with a single set_values call per chip.
+
+    Returns (updated_pins, failed_pins); a failing chip does not stop the others.
+    """
+    updated, failed = [], []
+    for chip_path, offsets in output_offsets.items():
+        pins = [reverse_pin_mapping[chip_path][offset] for offset in offsets]
+        try:
+            chip_requests[chip_path].set_values({offset: value for offset in offsets})
+        except (OSError, gpiod.RequestReleasedError) as e:
+            logger.error(f"Failed to set Pins {pins} on {chip_path}: {e}")
+            failed.extend(pins)
+            continue
+        for pin_num in pins:
+            output_state[pin_num] = value
+        updated.extend(pins)
+    return sorted(updated), sorted(failed)
+
+@app.post("/pins/all/high")
+async def set_all_high():
+    pins, failed = set_all_outputs(Value.ACTIVE)
+    return {"pins": pins, "failed": failed, "state": 1, "status": "partial" if failed else "success"}
+
+@app.post("/pins/all/low")
+async def set_all_low():
+    pins, failed = set_all_outputs(Value.INACTIVE)
+    return {"pins": pins, "failed": failed, "state": 0, "status": "partial" if failed else "success"}
+
+@app.post("/pins/batch")
+async def set_pins_batch(data: BatchSet):
+    """Set several output pins at once with a single set_values call per chip."""
+    results = []
+    # id(LineRequest) -> (LineRequest, {offset: Value}, [PinState, ...])
+    batches = {}
+    for update in data.updates:
+        pin_num = update.pin_num
+        req = pin_to_req[pin_num] if 0 <= pin_num < PIN_SLOTS else None
+        if req is None:
+            results.append({"pin_num": pin_num, "state": update.state, "status": "not active"})
+            continue
+        if output_state[pin_num] is None:
+            results.append({"pin_num": pin_num, "state": update.state, "status": "not an output"})
+            continue
+        _, values, updates = batches.setdefault(id(req), (req, {}, []))
+        values[pin_to_offset[pin_num]] = INT_TO_VALUE.get(update.state, Value.INACTIVE)
+        updates.append(update)
+
+    for req, values, updates in batches.values():
+        try:
+            req.set_values(values)
+            status = "success"
+        except (OSError, gpiod.RequestReleasedError) as e:
+            logger.error(f"Batch set failed for Pins {[u.pin_num for u in updates]}: {e}")
+            status = "error"
+        for update in updates:
+            if status == "success":
+                output_state[update.pin_num] = values[pin_to_offset[update.pin_num]]
+            results.append({"pin_num": update.pin_num, "state": update.state, "status": status})
+
+    return {"results": results}
+
+def read_log_tail(path: str, lines: int) -> List[str]:
+    """Return the last N lines of a file, reading fixed-size blocks backwards from EOF."""
+    if lines <= 0:
+        return []
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        newlines = 0
+        # One extra newline guarantees the first kept line is complete
+        while pos > 0 and newlines <= lines:
+            step = min(LOG_TAIL_CHUNK_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b"\n")
+            data = chunk + data
+    text = data.decode("utf-8", errors="replace")
+    return [line.strip() for line in text.splitlines()[-lines:]]
+
 @app.get("/logs")
 async def get_logs(lines: int = 100):
-    if not os.path.exists(LOG_FILE):
-        return {"logs": ["Log file not found"]}
     try:
-        # Read the last N lines efficiently
-        with open(LOG_FILE, "r") as f:
-            # For simplicity with rotating logs, we just read all lines if file is small, 
-            # or use deque for large files.
-            content = deque(f, maxlen=lines)
-            return {"logs": [line.strip() for line in content]}
+        # Disk read runs in a worker thread so other requests keep being served
+        return {"logs": await asyncio.to_thread(read_log_tail, LOG_FILE, lines)}
+    except FileNotFoundError:
+        return {"logs": ["Log file not found"]}
     except Exception as e:
         logger.error(f"Error reading logs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -651,43 +1078,29 @@ async def get_logs(lines: int = 100):
 @app.get("/loxone/status", response_class=PlainTextResponse)
 async def get_loxone_status():
     """PlainText status for Loxone parsing (Pin <NUM>=<VAL>)"""
-    output = []
-    
-    # Reload config to be safe
-    try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-    except:
+    if gpio_config is None:
+        logger.warning("Config unavailable for loxone/status")
         return "Error loading config"
 
-    for pin_cfg in config["pins"]:
-        pin_num = pin_cfg["num"]
-        mapping = pin_mapping.get(pin_num)
-        current_val = 0
-        
-        # If it's active, get real value
-        if mapping and mapping in line_requests:
-            try:
-                val = line_requests[mapping].get_value(mapping[1])
-                current_val = 1 if val == Value.ACTIVE else 0
-            except Exception as e:
-                logger.debug(f"Could not read value for pin {pin_num} in loxone/status: {e}")
-        
-        output.append(f"Pin {pin_num}={current_val}")
+    # One get_values per chip; unclaimed or unreadable pins report 0
+    values = read_line_values()
+    # Line prefixes and mappings are resolved once in build_status_plan
+    body = bytearray()
+    for prefix, mapping in loxone_plan:
+        body += prefix
+        body += b"1" if values.get(mapping) == Value.ACTIVE else b"0"
     
-    return "\n".join(output)
+    return Response(content=bytes(body), media_type="text/plain")
 
 @app.get("/loxone/stats", response_class=PlainTextResponse)
 async def get_loxone_stats():
     """PlainText system stats for Loxone parsing"""
-    info = get_system_info()
+    info = current_system_info()
     
     # CPU Temp
     cpu_temp = 0.0
     try:
-        if os.path.exists("/sys/class/thermal/thermal_zone0/temp"):
-            with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-                cpu_temp = int(f.read().strip()) / 1000.0
+        cpu_temp = read_cpu_temp() or 0.0
     except (IOError, ValueError) as e:
         logger.debug(f"Could not read CPU temperature for loxone/stats: {e}")
 
@@ -704,39 +1117,67 @@ async def get_loxone_stats():
     
     # Calculate Uptime Hours
     uptime_hours = 0.0
-    if os.path.exists("/proc/uptime"):
-        try:
-            with open("/proc/uptime", "r") as f:
-                uptime_seconds = float(f.readline().split()[0])
-                uptime_hours = round(uptime_seconds / 3600.0, 2)
-        except (IOError, ValueError, IndexError) as e:
-            logger.debug(f"Could not read uptime for loxone/stats: {e}")
+    try:
+        uptime_hours = round(get_uptime_seconds() / 3600.0, 2)
+    except OSError as e:
+        logger.debug(f"Could not read uptime for loxone/stats: {e}")
     output.append(f"UptimeHours={uptime_hours}")
 
     return "\n".join(output)
 
+# Last detected local IP: {"ip": str or None, "ts": time.monotonic() of detection}
+ip_cache = {"ip": None, "ts": 0.0}
+
+SIOCGIFADDR = 0x8915
+
+def default_route_ip() -> Optional[str]:
+    """IPv4 address of the interface holding the default route, straight from the kernel tables."""
+    best = None
+    with open("/proc/net/route", "r") as f:
+        next(f)  # Header: Iface Destination Gateway Flags RefCnt Use Metric ...
+        for line in f:
+            fields = line.split()
+            # Default route (destination 0.0.0.0) that is up (RTF_UP); the lowest metric wins
+            if len(fields) > 6 and fields[1] == "00000000" and int(fields[3], 16) & 0x1 \
+                    and (best is None or int(fields[6]) < best[1]):
+                best = (fields[0], int(fields[6]))
+    if best is None:
+        return None
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        ifreq = fcntl.ioctl(s.fileno(), SIOCGIFADDR, struct.pack("256s", best[0][:15].encode()))
+    return socket.inet_ntoa(ifreq[20:24])
+
 def get_ip_address():
+    now = time.monotonic()
+    if ip_cache["ip"] and now - ip_cache["ts"] < IP_CACHE_TTL_SEC:
+        return ip_cache["ip"]
+    try:
+        ip = default_route_ip()
+    except OSError as e:
+        # e.g. the default-route interface has no IPv4 address right now
+        logger.debug(f"Default route lookup failed, falling back: {e}")
+        ip = None
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(('8.8.8.8', 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
-    except (OSError, socket.error) as e:
+        if ip is None:
+            # No usable default route in the table: fall back to asking the routing code
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(('8.8.8.8', 80))
+                ip = s.getsockname()[0]
+    except OSError as e:
+        # Not cached, so the next call retries as soon as the network is back
         logger.debug(f"Could not determine IP address: {e}")
         return "127.0.0.1"
+    ip_cache["ip"] = ip
+    ip_cache["ts"] = now
+    return ip
 
-@app.get("/loxone/template/inputs", response_class=Response)
-async def get_loxone_input_template():
-    """Generate Loxone Virtual Input Template XML"""
-    ip_addr = get_ip_address()
+def xml_attr(value) -> str:
+    """Escape a value for use inside a double-quoted XML attribute."""
+    return escape(str(value), {'"': "&quot;"})
+
+def render_loxone_inputs(config: Dict, ip_addr: str) -> str:
+    """Render the Loxone Virtual Input template for input pins."""
     base_url = f"http://{ip_addr}:8000"
-    
-    try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-    except:
-        raise HTTPException(500, "Config error")
 
     # Structure based on user provided working example:
     # <VirtualInHttp ...> (The Connector)
@@ -753,7 +1194,7 @@ async def get_loxone_input_template():
         # Only generate Virtual Inputs for pins explicitly configured as 'input'
         if pin_cfg.get("direction", "output").lower() == "input":
             pin_num = pin_cfg["num"]
-            name = pin_cfg.get("name", str(pin_num))
+            name = xml_attr(pin_cfg.get("name", pin_num))
             
             # Use Analog="false" for standard digital inputs to appear correctly in Loxone
             xml_lines.append(
@@ -763,22 +1204,11 @@ async def get_loxone_input_template():
             )
 
     xml_lines.append('</VirtualInHttp>')
-    # Adding UTF-8 BOM (\ufeff) for Loxone Config compatibility on Windows
-    xml_content = "\ufeff" + "\n".join(xml_lines)
-    
-    return Response(content=xml_content, media_type="application/xml", headers={"Content-Disposition": 'attachment; filename="LoxIO_Inputs.xml"'})
+    return "\n".join(xml_lines)
 
-@app.get("/loxone/template/outputs", response_class=Response)
-async def get_loxone_output_template():
-    """Generate Loxone Virtual Output Template XML for Output pins"""
-    ip_addr = get_ip_address()
+def render_loxone_outputs(config: Dict, ip_addr: str) -> str:
+    """Render the Loxone Virtual Output template for output pins."""
     base_url = f"http://{ip_addr}:8000"
-    
-    try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-    except:
-        raise HTTPException(500, "Config error")
 
     xml_lines = [
         '<?xml version="1.0" encoding="utf-8"?>',
@@ -790,10 +1220,10 @@ async def get_loxone_output_template():
     for pin_cfg in config["pins"]:
         if pin_cfg.get("direction", "output").lower() == "output":
             pin_num = pin_cfg["num"]
-            name = pin_cfg.get("name", str(pin_num))
+            name = xml_attr(pin_cfg.get("name", pin_num))
             
-            on_body = json.dumps({"pin_num": pin_num, "state": 1}).replace('"', '&quot;')
-            off_body = json.dumps({"pin_num": pin_num, "state": 0}).replace('"', '&quot;')
+            on_body = xml_attr(json.dumps({"pin_num": pin_num, "state": 1}))
+            off_body = xml_attr(json.dumps({"pin_num": pin_num, "state": 0}))
             
             xml_lines.append(
                 f'  <VirtualOutCmd Title="Pin {pin_num} ({name})" Comment="" '
@@ -804,16 +1234,10 @@ async def get_loxone_output_template():
             )
 
     xml_lines.append('</VirtualOut>')
-    
-    # Adding UTF-8 BOM (\ufeff)
-    xml_content = "\ufeff" + "\n".join(xml_lines)
-    
-    return Response(content=xml_content, media_type="application/xml", headers={"Content-Disposition": 'attachment; filename="LoxIO_Outputs.xml"'})
+    return "\n".join(xml_lines)
 
-@app.get("/loxone/template/stats", response_class=Response)
-async def get_loxone_stats_template():
-    """Generate Loxone Virtual Input Template XML for System Stats"""
-    ip_addr = get_ip_address()
+def render_loxone_stats(config: Dict, ip_addr: str) -> str:
+    """Render the Loxone Virtual Input template for system stats (config unused)."""
     base_url = f"http://{ip_addr}:8000"
     
     xml_lines = [
@@ -835,35 +1259,141 @@ async def get_loxone_stats_template():
     add_cmd("RAM Usage", "RamPercent", "%")
     add_cmd("Uptime", "UptimeHours", "h")
 
-    # Adding UTF-8 BOM (\ufeff)
-    xml_content = "\ufeff" + "\n".join(xml_lines)
-    
-    return Response(content=xml_content, media_type="application/xml", headers={"Content-Disposition": 'attachment; filename="LoxIO_Stats.xml"'})
+    return "\n".join(xml_lines)
+
+LOXONE_TEMPLATES = {
+    # kind: (renderer, download filename, needs config)
+    "inputs": (render_loxone_inputs, "LoxIO_Inputs.xml", True),
+    "outputs": (render_loxone_outputs, "LoxIO_Outputs.xml", True),
+    "stats": (render_loxone_stats, "LoxIO_Stats.xml", False),
+}
+# Rendered templates: kind -> ((ip_addr, config_mtime), xml_bytes)
+loxone_template_cache = {}
+
+def loxone_template_response(kind: str) -> Response:
+    """Serve a Loxone template, re-rendering only when the IP or the config changed."""
+    renderer, filename, needs_config = LOXONE_TEMPLATES[kind]
+    ip_addr = get_ip_address()
+    config = None
+    if needs_config:
+        try:
+            config = load_config()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Config unavailable for Loxone template: {e}")
+            raise HTTPException(500, "Config error")
+
+    key = (ip_addr, config_mtime if needs_config else None)
+    cached = loxone_template_cache.get(kind)
+    if cached is None or cached[0] != key:
+        # Adding UTF-8 BOM (\ufeff) for Loxone Config compatibility on Windows
+        cached = (key, ("\ufeff" + renderer(config, ip_addr)).encode("utf-8"))
+        loxone_template_cache[kind] = cached
+
+    return Response(content=cached[1], media_type="application/xml", headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+@app.get("/loxone/template/inputs", response_class=Response)
+async def get_loxone_input_template():
+    """Generate Loxone Virtual Input Template XML"""
+    return loxone_template_response("inputs")
+
+@app.get("/loxone/template/outputs", response_class=Response)
+async def get_loxone_output_template():
+    """Generate Loxone Virtual Output Template XML for Output pins"""
+    return loxone_template_response("outputs")
+
+@app.get("/loxone/template/stats", response_class=Response)
+async def get_loxone_stats_template():
+    """Generate Loxone Virtual Input Template XML for System Stats"""
+    return loxone_template_response("stats")
+
+async def run_command(cmd: List[str], env: Optional[Dict] = None, cwd: Optional[str] = None,
+                      check: bool = False) -> subprocess.CompletedProcess:
+    """Run a command without blocking the event loop; output is decoded text.
+
+    With check=True a non-zero exit raises subprocess.CalledProcessError.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        cwd=cwd
+    )
+    stdout, stderr = await proc.communicate()
+    result = subprocess.CompletedProcess(
+        cmd, proc.returncode,
+        stdout.decode(errors="replace"), stderr.decode(errors="replace")
+    )
+    if check:
+        result.check_returncode()
+    return result
+
+async def git_output(*args: str) -> str:
+    """Run a git command in APP_DIR and return its stripped stdout."""
+    result = await run_command(["git", *args], cwd=APP_DIR, check=True)
+    return result.stdout.strip()
+
+def read_git_head(git_dir: str) -> str:
+    """Resolve HEAD to a commit hash by reading the repository files, without spawning git."""
+    with open(os.path.join(git_dir, "HEAD"), "r") as f:
+        head = f.read().strip()
+    if not head.startswith("ref: "):
+        return head  # Detached HEAD holds the hash itself
+    ref = head[5:]
+    try:
+        with open(os.path.join(git_dir, ref), "r") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        # Ref was packed by git gc: "<hash> <ref>" lines in packed-refs
+        with open(os.path.join(git_dir, "packed-refs"), "r") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+    raise ValueError(f"Cannot resolve {ref}")
+
+async def get_local_hash() -> str:
+    """Hash of the checked-out commit; falls back to git for unusual layouts (e.g. worktrees)."""
+    try:
+        return read_git_head(os.path.join(APP_DIR, ".git"))
+    except (OSError, ValueError):
+        return await git_output("rev-parse", "HEAD")
+
+async def get_remote_hash() -> str:
+    """Hash of origin/main as advertised by the remote; no objects are downloaded."""
+    output = await git_output("ls-remote", "origin", "refs/heads/main")
+    if not output:
+        raise RuntimeError("Remote branch 'main' not found")
+    return output.split()[0]
+
+# Last successful /update/check result: {"result": dict or None, "ts": time.monotonic()}
+update_check_cache = {"result": None, "ts": 0.0}
 
 @app.get("/update/check")
-async def check_update():
-    """Check if update is available"""
+async def check_update(force: bool = False):
+    """Check if update is available (cached for UPDATE_CHECK_TTL_SEC unless ?force=1)"""
+    now = time.monotonic()
+    if not force and update_check_cache["result"] and now - update_check_cache["ts"] < UPDATE_CHECK_TTL_SEC:
+        return update_check_cache["result"]
+    # Read the local hash once; an offline remote lookup must not re-run git for it
+    local_hash = "Unknown"
     try:
-        # Fetch latest changes without applying
-        subprocess.run(["git", "fetch", "origin", "main"], cwd=APP_DIR, check=True)
-        
-        # Get local and remote hashes
-        local_hash = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=APP_DIR, text=True).strip()
-        remote_hash = subprocess.check_output(["git", "rev-parse", "origin/main"], cwd=APP_DIR, text=True).strip()
+        # Get local and remote hashes (the update script does the actual fetch)
+        local_hash = await get_local_hash()
+        remote_hash = await get_remote_hash()
         
         update_available = local_hash != remote_hash
-        return {
+        result = {
             "update_available": update_available,
             "local_hash": local_hash,
             "remote_hash": remote_hash
         }
+        # Errors are not cached, so the next check retries right away
+        update_check_cache["result"] = result
+        update_check_cache["ts"] = now
+        return result
     except Exception as e:
         logger.warning(f"Update check failed: {e}")
-        local_hash = "Unknown"
-        try:
-            local_hash = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=APP_DIR, text=True).strip()
-        except subprocess.CalledProcessError as git_err:
-            logger.debug(f"Could not get local git hash: {git_err}")
         return {
             "error": str(e),
             "update_available": False,
@@ -876,9 +1406,8 @@ async def ota_update(force: bool = False):
     try:
         # First check if update is needed (unless forced)
         if not force:
-             subprocess.run(["git", "fetch", "origin", "main"], cwd=APP_DIR, check=True)
-             local = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=APP_DIR, text=True).strip()
-             remote = subprocess.check_output(["git", "rev-parse", "origin/main"], cwd=APP_DIR, text=True).strip()
+             local = await get_local_hash()
+             remote = await get_remote_hash()
              if local == remote:
                  return {"status": "skipped", "message": "Already up to date"}
 
@@ -902,6 +1431,15 @@ async def ota_update(force: bool = False):
 
 # --- Network Management Endpoints ---
 
+def nmcli_rows(output: str) -> List[List[str]]:
+    """Split nmcli -t output into fields.
+
+    Terse mode separates fields with ':' and escapes ':' and '\\' inside values
+    with a backslash, which is exactly csv's escapechar handling.
+    """
+    return [row for row in csv.reader(output.splitlines(), delimiter=':', escapechar='\\',
+                                      quoting=csv.QUOTE_NONE) if row]
+
 @app.get("/network/status")
 async def network_status():
     """Get comprehensive network status for both WiFi and Ethernet"""
@@ -912,9 +1450,8 @@ async def network_status():
         
         # Get device status
         # Format: DEVICE:TYPE:STATE:CONNECTION
-        dev_cmd = subprocess.run(
-            ["nmcli", "-t", "-f", "DEVICE,TYPE,STATE,CONNECTION", "dev"],
-            capture_output=True, text=True, env=env
+        dev_cmd = await run_command(
+            ["nmcli", "-t", "-f", "DEVICE,TYPE,STATE,CONNECTION", "dev"], env=env
         )
         
         status = {
@@ -924,8 +1461,7 @@ async def network_status():
         }
 
         if dev_cmd.returncode == 0:
-            for line in dev_cmd.stdout.strip().split('\n'):
-                parts = line.split(':')
+            for parts in nmcli_rows(dev_cmd.stdout):
                 if len(parts) < 3: continue
                 device, dev_type, state = parts[0], parts[1], parts[2]
                 conn_name = parts[3] if len(parts) > 3 else None
@@ -940,19 +1476,6 @@ async def network_status():
                     if is_connected:
                         status["wifi"]["active"] = True
                         status["wifi"]["ssid"] = conn_name
-                        
-                        # Get signal
-                        sig_cmd = subprocess.run(
-                             ["nmcli", "-t", "-f", "SSID,SIGNAL", "dev", "wifi"],
-                             capture_output=True, text=True, env=env
-                        )
-                        if sig_cmd.stdout:
-                             for sig_line in sig_cmd.stdout.split('\n'):
-                                 if sig_line.startswith(str(conn_name) + ":"):
-                                     try:
-                                         status["wifi"]["signal_percent"] = int(sig_line.split(":")[1])
-                                     except: pass
-                                     break
                 
                 elif dev_type == "ethernet":
                     status["ethernet"]["device"] = device
@@ -962,46 +1485,54 @@ async def network_status():
                         status["ethernet"]["active"] = True
                         status["ethernet"]["connection"] = conn_name if conn_name else "System Managed"
 
+        # Signal of the network the radio is associated with, only if Wi-Fi is connected
+        # Format: ACTIVE:SIGNAL (--rescan no: never wait for a radio scan just to report it)
+        if status["wifi"]["active"]:
+            wifi_cmd = await run_command(
+                ["nmcli", "-t", "-f", "ACTIVE,SIGNAL", "dev", "wifi", "list",
+                 "--rescan", "no", "ifname", status["wifi"]["device"]], env=env
+            )
+            for wifi_parts in nmcli_rows(wifi_cmd.stdout):
+                if len(wifi_parts) == 2 and wifi_parts[0] == "yes":
+                    try:
+                        status["wifi"]["signal_percent"] = int(wifi_parts[1])
+                    except ValueError: pass
+                    break
+
         return status
     except Exception as e:
          raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/network/scan")
-async def network_scan():
-    """Scan for available Wi-Fi networks"""
+async def network_scan(rescan: bool = False):
+    """Scan for available Wi-Fi networks (pass ?rescan=1 to force a fresh radio scan)"""
     try:
-        # Rescan first
-        subprocess.run(["nmcli", "dev", "wifi", "rescan"], capture_output=True)
+        # A radio rescan takes seconds, so only do it when explicitly requested
+        if rescan:
+            await run_command(["nmcli", "dev", "wifi", "rescan"])
         
         # Get list
         # SSID,SIGNAL,SECURITY
-        cmd = subprocess.run(
-            ["nmcli", "-t", "-f", "SSID,SIGNAL,SECURITY,BARS", "dev", "wifi", "list"],
-            capture_output=True, text=True
+        cmd = await run_command(
+            ["nmcli", "-t", "-f", "SSID,SIGNAL,SECURITY,BARS", "dev", "wifi", "list"]
         )
         
         networks = []
         seen_ssids = set()
         
         if cmd.returncode == 0:
-            for line in cmd.stdout.split('\n'):
-                if not line: continue
-                # nmcli escapes colons with backslashes in SSID, handling that strictly is hard with just split.
-                # Assuming simple SSIDs for now or last fields.
-                # Format: SSID:SIGNAL:SECURITY:BARS
-                
-                parts = line.split(':')
-                if len(parts) >= 3:
-                     # Join all parts except last 3 as SSID (in case SSID contains colon)
-                     ssid = ":".join(parts[:-3])
+            # Format: SSID:SIGNAL:SECURITY:BARS
+            for parts in nmcli_rows(cmd.stdout):
+                if len(parts) == 4:
+                     ssid = parts[0]
                      if not ssid: continue # hidden SSID
                      
                      if ssid not in seen_ssids:
                          networks.append({
                              "ssid": ssid,
-                             "signal": int(parts[-3]),
-                             "security": parts[-2],
-                             "bars": parts[-1]
+                             "signal": int(parts[1]),
+                             "security": parts[2],
+                             "bars": parts[3]
                          })
                          seen_ssids.add(ssid)
         
@@ -1013,12 +1544,11 @@ async def network_scan():
 @app.post("/network/connect")
 async def network_connect(data: WifiConnect):
     """Connect to a Wi-Fi network"""
-    # This is a blocking operation and might take time.
+    # This might take a while; awaiting keeps the event loop serving other requests.
     try:
         # nmcli dev wifi connect <SSID> password <PASSWORD>
-        result = subprocess.run(
-            ["nmcli", "dev", "wifi", "connect", data.ssid, "password", data.password],
-            capture_output=True, text=True
+        result = await run_command(
+            ["nmcli", "dev", "wifi", "connect", data.ssid, "password", data.password]
         )
         
         if result.returncode == 0:
@@ -1029,68 +1559,69 @@ async def network_connect(data: WifiConnect):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Name of the onboard Ethernet device; it is fixed hardware, so it is looked up once
+eth_device_cache = {"dev": None}
+
+async def find_ethernet_device() -> Optional[str]:
+    """Return the first device of type 'ethernet' known to NetworkManager."""
+    if eth_device_cache["dev"]:
+        return eth_device_cache["dev"]
+    dev_cmd = await run_command(["nmcli", "-t", "-f", "DEVICE,TYPE", "dev"])
+    for parts in nmcli_rows(dev_cmd.stdout):
+        if len(parts) == 2 and parts[1] == "ethernet":
+            # Only a successful lookup is cached
+            eth_device_cache["dev"] = parts[0]
+            break
+    return eth_device_cache["dev"]
+
 @app.post("/network/ethernet")
 async def configure_ethernet(data: EthernetConfig):
     """Configure Ethernet (DHCP or Static IP)"""
+    if data.method == "manual" and (not data.ip or not data.gateway):
+        raise HTTPException(status_code=400, detail="IP and Gateway required for manual mode")
+
+    # Connection Name usually 'Wired connection 1' or similar.
+    # We will create/modify a connection named 'eth-config' for consistency
+    con_name = "eth-config"
+
     try:
-        # Identify Ethernet Interface (usually eth0 or end0 on OrangePi)
-        # We find the device with type 'ethernet'
-        dev_cmd = subprocess.run(
-            ["nmcli", "-t", "-f", "DEVICE,TYPE", "dev"],
-            capture_output=True, text=True
+        # Identify Ethernet Interface (usually eth0 or end0 on OrangePi) and check
+        # whether our connection exists; the two nmcli probes are independent
+        eth_dev, check_con = await asyncio.gather(
+            find_ethernet_device(),
+            run_command(["nmcli", "con", "show", con_name])
         )
-        eth_dev = None
-        if dev_cmd.stdout:
-            for line in dev_cmd.stdout.split('\n'):
-                if ":ethernet" in line:
-                    eth_dev = line.split(':')[0]
-                    break
         
         if not eth_dev:
              return {"status": "error", "message": "No Ethernet device found"}
 
-        # Connection Name usually 'Wired connection 1' or similar.
-        # We will create/modify a connection named 'eth-config' for consistency
-        con_name = "eth-config"
-        
-        # Check if connection exists
-        check_con = subprocess.run(
-            ["nmcli", "con", "show", con_name],
-            capture_output=True
-        )
-        
-        cmds = []
-        if check_con.returncode != 0:
-            # Create new connection
-            cmds.append(["nmcli", "con", "add", "con-name", con_name, "ifname", eth_dev, "type", "ethernet"])
-        
-        # Configure Method
+        # Configure Method: all ipv4 properties are passed to a single nmcli call
+        ipv4_props = []
         if data.method == "auto":
-             cmds.append(["nmcli", "con", "mod", con_name, "ipv4.method", "auto"])
-             cmds.append(["nmcli", "con", "mod", con_name, "ipv4.addresses", ""])
-             cmds.append(["nmcli", "con", "mod", con_name, "ipv4.gateway", ""])
-             cmds.append(["nmcli", "con", "mod", con_name, "ipv4.dns", ""])
+             ipv4_props = ["ipv4.method", "auto", "ipv4.addresses", "", "ipv4.gateway", "", "ipv4.dns", ""]
         elif data.method == "manual":
-             if not data.ip or not data.gateway:
-                 raise HTTPException(status_code=400, detail="IP and Gateway required for manual mode")
-             
              # IP Format: 192.168.1.50/24
              ip_cidr = data.ip if "/" in data.ip else f"{data.ip}/24"
              
-             cmds.append(["nmcli", "con", "mod", con_name, "ipv4.method", "manual"])
-             cmds.append(["nmcli", "con", "mod", con_name, "ipv4.addresses", ip_cidr])
-             cmds.append(["nmcli", "con", "mod", con_name, "ipv4.gateway", data.gateway])
+             ipv4_props = ["ipv4.method", "manual", "ipv4.addresses", ip_cidr, "ipv4.gateway", data.gateway]
              if data.dns:
-                 cmds.append(["nmcli", "con", "mod", con_name, "ipv4.dns", data.dns])
+                 ipv4_props += ["ipv4.dns", data.dns]
+        
+        cmd = None
+        if check_con.returncode != 0:
+            # Create new connection with its settings
+            cmd = ["nmcli", "con", "add", "con-name", con_name, "ifname", eth_dev, "type", "ethernet", *ipv4_props]
+        elif ipv4_props:
+            cmd = ["nmcli", "con", "mod", con_name, *ipv4_props]
         
         # Apply changes
-        for cmd in cmds:
-            r = subprocess.run(cmd, capture_output=True, text=True)
+        if cmd:
+            r = await run_command(cmd)
             if r.returncode != 0:
                 return {"status": "error", "message": f"Command failed: {' '.join(cmd)}", "details": r.stderr}
 
         # Bring Up Connection
-        up_res = subprocess.run(["nmcli", "con", "up", con_name], capture_output=True, text=True)
+        up_res = await run_command(["nmcli", "con", "up", con_name])
         
         if up_res.returncode == 0:
              return {"status": "success", "message": f"Ethernet configured ({data.method})", "details": up_res.stdout}
@@ -1109,13 +1640,18 @@ async def system_reboot():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def save_upload(src, path: str) -> None:
+    """Copy an uploaded file to disk (blocking; run it in a worker thread)."""
+    with open(path, "wb") as buffer:
+        shutil.copyfileobj(src, buffer, UPLOAD_COPY_CHUNK_BYTES)
+
 @app.post("/update/zip")
 async def zip_update(file: UploadFile = File(...)):
     """Handle manual ZIP update upload"""
     try:
         tmp_path = f"/tmp/{file.filename}"
-        with open(tmp_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # A multi-MB copy must not stall GPIO requests on the event loop
+        await asyncio.to_thread(save_upload, file.file, tmp_path)
         
         # Trigger the manual update script in the background
         # (It will restart this service)
@@ -1138,11 +1674,10 @@ async def system_shutdown():
 @app.get("/config")
 async def get_config():
     """Retrieve the current GPIO configuration."""
-    if not os.path.exists(CONFIG_FILE):
-         raise HTTPException(status_code=404, detail="Config file missing")
     try:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
+        return load_config()
+    except FileNotFoundError:
+         raise HTTPException(status_code=404, detail="Config file missing")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1157,24 +1692,36 @@ async def update_config(config: Dict):
             raise HTTPException(status_code=400, detail=str(e))
         
         # Save to file
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
+        await asyncio.to_thread(write_config_file, config)
         
         logger.info("Configuration updated via API. Reloading hardware...")
         
-        # Hot-reload GPIOs
-        release_gpios()
-        init_gpios()
-        
-        # Restart interrupt task
-        global interrupt_task
-        interrupt_task = asyncio.create_task(monitor_interrupts())
+        # Hot-reload GPIOs (init_gpios re-reads the config into memory)
+        reload_gpios()
         
         return {"status": "success", "message": "Configuration updated and hardware reloaded"}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Config update failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/config/reload")
+async def reload_config_from_disk():
+    """Re-read the GPIO configuration file (e.g. after a manual edit) and reload hardware."""
+    try:
+        validate_gpio_config(await asyncio.to_thread(read_config_file))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Config file missing")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    logger.info("Configuration reload requested via API. Reloading hardware...")
+    reload_gpios()
+    return {"status": "success", "message": "Configuration reloaded from disk"}
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" picks uvloop/httptools (requirements.txt) when installed, and still
+    # starts on the stock asyncio loop and h11 parser if a venv lacks them
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto")
@@ -9,6 +9,8 @@ APP_DIR="/root/opi_gpio_app"
 LOG_FILE="$APP_DIR/app.log"
 SERVICE="opi_gpio.service"
 HEALTH_URL="http://127.0.0.1:8000/health"
+PIP="$APP_DIR/venv/bin/pip"
+PIP_TIMEOUT=600
 
 # Create secure temp directory (not world-readable)
 EXTRACT_DIR=$(mktemp -d -t loxio_update.XXXXXX)
@@ -46,6 +48,25 @@ wait_for_healthy() {
     return 1
 }
 
+# Install requirements.txt into the venv (new releases may add packages)
+install_requirements() {
+    local req_file="$1"
+    if [ ! -f "$req_file" ]; then
+        log "Warning: $req_file not found, skipping dependency install"
+        return 0
+    fi
+    if [ ! -x "$PIP" ]; then
+        log "Warning: $PIP not found, skipping dependency install"
+        return 0
+    fi
+    timeout $PIP_TIMEOUT "$PIP" install -r "$req_file" --quiet 2>&1 || return 1
+    # main.py uses the Pydantic v2 API; old venvs may still hold v1
+    if ! "$APP_DIR/venv/bin/python3" -c 'import pydantic, sys; sys.exit(int(pydantic.VERSION.split(".")[0]) < 2)'; then
+        log "Error: Pydantic 2 is not importable from the venv after install"
+        return 1
+    fi
+}
+
 # Validate arguments
 ZIP_FILE="${1:-}"
 if [ -z "$ZIP_FILE" ]; then
@@ -86,6 +107,14 @@ fi
 
 log "Found application root at: $SUBDIR"
 
+# Install dependencies before touching the app files, so a failed install
+# leaves the running version in place
+log "Installing Python dependencies..."
+if ! install_requirements "$SUBDIR/requirements.txt"; then
+    log "Error: Dependency install failed (or timed out after ${PIP_TIMEOUT}s), keeping current version"
+    exit 1
+fi
+
 # Backup current config with secure permissions
 CONFIG_BACKUP=""
 if [ -f "$APP_DIR/gpio_config.json" ]; then
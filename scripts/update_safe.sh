@@ -11,6 +11,8 @@ WEB_SERVICE="opi_web.service"
 LOG_FILE="$APP_DIR/app.log"
 HEALTH_URL="http://127.0.0.1:8000/health"
 GIT_TIMEOUT=60
+PIP="$APP_DIR/venv/bin/pip"
+PIP_TIMEOUT=600
 
 log() {
     local msg="$(date '+%Y-%m-%d %H:%M:%S'): $1"
@@ -38,6 +40,25 @@ wait_for_healthy() {
     return 1
 }
 
+# Install requirements.txt into the venv (new releases may add packages)
+install_requirements() {
+    local req_file="$1"
+    if [ ! -f "$req_file" ]; then
+        log "Warning: $req_file not found, skipping dependency install"
+        return 0
+    fi
+    if [ ! -x "$PIP" ]; then
+        log "Warning: $PIP not found, skipping dependency install"
+        return 0
+    fi
+    timeout $PIP_TIMEOUT "$PIP" install -r "$req_file" --quiet 2>&1 || return 1
+    # main.py uses the Pydantic v2 API; old venvs may still hold v1
+    if ! "$APP_DIR/venv/bin/python3" -c 'import pydantic, sys; sys.exit(int(pydantic.VERSION.split(".")[0]) < 2)'; then
+        log "Error: Pydantic 2 is not importable from the venv after install"
+        return 1
+    fi
+}
+
 # Change to app directory
 cd "$APP_DIR" || { log "ERROR: Failed to cd to $APP_DIR"; exit 1; }
 
@@ -72,25 +93,31 @@ fi
 NEW_COMMIT=$(git rev-parse HEAD 2>/dev/null || echo "unknown")
 log "Updated to commit: $NEW_COMMIT"
 
-# 5. Restart services using systemd-run to ensure they complete independently
-log "Restarting services..."
-systemd-run --no-block --unit=loxio-restart-api systemctl restart "$SERVICE"
-systemd-run --no-block --unit=loxio-restart-web systemctl restart "$WEB_SERVICE"
-log "Service restart commands issued"
-
-# Brief pause for systemd to start the transient units
-sleep 1
-
-# 6. Verify health with exponential backoff
-log "Verifying service health..."
-if wait_for_healthy; then
-    log "SUCCESS: Update verified, system is healthy"
-    log "=== LoxIO Core Safe Update Completed ==="
-    exit 0
+# 5. Install Python dependencies of the new version
+log "Installing Python dependencies..."
+if install_requirements "$APP_DIR/requirements.txt"; then
+    # 6. Restart services using systemd-run to ensure they complete independently
+    log "Restarting services..."
+    systemd-run --no-block --unit=loxio-restart-api systemctl restart "$SERVICE"
+    systemd-run --no-block --unit=loxio-restart-web systemctl restart "$WEB_SERVICE"
+    log "Service restart commands issued"
+
+    # Brief pause for systemd to start the transient units
+    sleep 1
+
+    # 7. Verify health with exponential backoff
+    log "Verifying service health..."
+    if wait_for_healthy; then
+        log "SUCCESS: Update verified, system is healthy"
+        log "=== LoxIO Core Safe Update Completed ==="
+        exit 0
+    fi
+    log "CRITICAL: Update FAILED - API not responding"
+else
+    log "CRITICAL: Update FAILED - dependency install failed (or timed out after ${PIP_TIMEOUT}s)"
 fi
 
-# 7. Rollback on failure
-log "CRITICAL: Update FAILED - API not responding"
+# 8. Rollback on failure
 log "Rolling back to $COMMIT_BEFORE..."
 
 if git reset --hard "$COMMIT_BEFORE" 2>&1; then
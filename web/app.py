@@ -1,6 +1,10 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Flask, render_template, request, jsonify, redirect, url_for, Response
+import json
 import requests
+from requests.adapters import HTTPAdapter
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 app = Flask(__name__)
@@ -12,39 +16,78 @@ logger = logging.getLogger("LoxIO-Web")
 # The GPIO API base URL - defaults to localhost for same-device deployment
 API_BASE_URL = os.environ.get("GPIO_API_URL", "http://localhost:8000")
 
-def api_get(endpoint):
-    try:
-        response = requests.get(f"{API_BASE_URL}{endpoint}", timeout=10)
-        return response.json()
-    except requests.exceptions.ConnectionError as e:
-        logger.error(f"API connection failed for GET {endpoint}: {e}")
+# One pooled session for all backend calls: keep-alive connections are reused
+# instead of opening a new TCP connection on every proxied request
+api_session = requests.Session()
+api_session.mount(API_BASE_URL, HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Pages that need several backend calls issue them in parallel
+fetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="api-fetch")
+
+# Short-lived cache of successful GET responses (seconds per endpoint), so
+# refreshes and concurrent viewers within the window share one backend call.
+# Any POST clears it, so a page never shows state older than the last change.
+API_CACHE_TTL_SEC = {
+    "/health": 3,
+    "/network/status": 3,
+    "/pins/status": 1,
+    "/config": 3,
+}
+api_cache = {}  # endpoint -> (expires_at, body, status, content_type)
+
+def api_error(method, endpoint, e):
+    """Log a failed backend call and return the error payload shown to the UI."""
+    if isinstance(e, requests.exceptions.ConnectionError):
+        logger.error(f"API connection failed for {method} {endpoint}: {e}")
         return {"error": "API unavailable - connection refused"}
-    except requests.exceptions.Timeout as e:
-        logger.warning(f"API timeout for GET {endpoint}: {e}")
+    if isinstance(e, requests.exceptions.Timeout):
+        logger.warning(f"API timeout for {method} {endpoint}: {e}")
         return {"error": "API request timed out"}
+    logger.error(f"Unexpected error for {method} {endpoint}: {e}")
+    return {"error": str(e)}
+
+def fetch_raw(endpoint):
+    """GET a backend endpoint and return (body bytes, status, content type)."""
+    ttl = API_CACHE_TTL_SEC.get(endpoint)
+    if ttl:
+        cached = api_cache.get(endpoint)
+        if cached and cached[0] > time.monotonic():
+            return cached[1:]
+    response = api_session.get(f"{API_BASE_URL}{endpoint}", timeout=10)
+    result = (response.content, response.status_code, response.headers.get("Content-Type", "application/json"))
+    if ttl and response.ok:
+        api_cache[endpoint] = (time.monotonic() + ttl, *result)
+    return result
+
+def api_get(endpoint):
+    """GET a backend endpoint and parse it, for pages that use the data."""
+    try:
+        return json.loads(fetch_raw(endpoint)[0])
     except Exception as e:
-        logger.error(f"Unexpected error for GET {endpoint}: {e}")
-        return {"error": str(e)}
+        return api_error("GET", endpoint, e)
 
-def api_post(endpoint, data=None):
+# The AJAX proxies forward the backend body untouched instead of parsing it
+# and serializing it again with jsonify
+def proxy_get(endpoint):
     try:
-        response = requests.post(f"{API_BASE_URL}{endpoint}", json=data, timeout=10)
-        return response.json()
-    except requests.exceptions.ConnectionError as e:
-        logger.error(f"API connection failed for POST {endpoint}: {e}")
-        return {"error": "API unavailable - connection refused"}
-    except requests.exceptions.Timeout as e:
-        logger.warning(f"API timeout for POST {endpoint}: {e}")
-        return {"error": "API request timed out"}
+        body, status, content_type = fetch_raw(endpoint)
     except Exception as e:
-        logger.error(f"Unexpected error for POST {endpoint}: {e}")
-        return {"error": str(e)}
+        return jsonify(api_error("GET", endpoint, e))
+    return Response(body, status=status, content_type=content_type)
+
+def proxy_post(endpoint, body=None):
+    api_cache.clear()
+    try:
+        headers = {"Content-Type": "application/json"} if body else None
+        response = api_session.post(f"{API_BASE_URL}{endpoint}", data=body, headers=headers, timeout=10)
+    except Exception as e:
+        return jsonify(api_error("POST", endpoint, e))
+    return Response(response.content, status=response.status_code,
+                    content_type=response.headers.get("Content-Type", "application/json"))
 
 @app.route('/')
 def index():
-    health = api_get("/health")
-    net_status = api_get("/network/status")
-    pins = api_get("/pins/status")
+    health, net_status, pins = fetch_pool.map(api_get, ["/health", "/network/status", "/pins/status"])
     
     # Defensive structures in case of API failure
     if "error" in health:
@@ -81,10 +124,9 @@ def network_page():
 
 @app.route('/system')
 def system_page():
-    health = api_get("/health")
+    health, update_info = fetch_pool.map(api_get, ["/health", "/update/check"])
     if "error" in health:
         health = {"system_stats": {"cpu_temp_c": 0, "ram": {"percent": 0}}, "board_info": {"uptime": "Unknown", "hostname": "Unknown", "os": "Unknown", "kernel": "Unknown"}}
-    update_info = api_get("/update/check")
     if "error" in update_info:
         update_info = {"local_hash": "Unknown", "update_available": False, "error": True}
     return render_template('system.html', health=health, update_info=update_info)
@@ -99,47 +141,46 @@ def settings_page():
 # API Proxies for AJAX calls
 @app.route('/api/pins/toggle/<int:pin_num>', methods=['POST'])
 def toggle_pin(pin_num):
-    return jsonify(api_post(f"/pins/toggle/{pin_num}"))
+    return proxy_post(f"/pins/toggle/{pin_num}")
 
 @app.route('/api/pins/status')
 def get_pins_status():
-    return jsonify(api_get("/pins/status"))
+    return proxy_get("/pins/status")
 
 @app.route('/api/network/scan')
 def scan_wifi():
-    return jsonify(api_get("/network/scan"))
+    rescan = request.args.get('rescan', 'false').lower() in ('1', 'true')
+    return proxy_get("/network/scan?rescan=1" if rescan else "/network/scan")
 
 @app.route('/api/network/connect', methods=['POST'])
 def connect_wifi():
-    data = request.json
-    return jsonify(api_post("/network/connect", data))
+    return proxy_post("/network/connect", request.get_data())
 
 @app.route('/api/network/ethernet', methods=['POST'])
 def config_ethernet():
-    data = request.json
-    return jsonify(api_post("/network/ethernet", data))
+    return proxy_post("/network/ethernet", request.get_data())
 
 @app.route('/api/health')
 def get_health():
-    return jsonify(api_get("/health"))
+    return proxy_get("/health")
 
 @app.route('/api/stats/history')
 def get_stats_history():
-    return jsonify(api_get("/stats/history"))
+    return proxy_get("/stats/history")
 
 @app.route('/api/update/ota', methods=['POST'])
 def trigger_update():
     force = request.args.get('force', 'false').lower() == 'true'
     endpoint = "/update/ota?force=true" if force else "/update/ota"
-    return jsonify(api_post(endpoint))
+    return proxy_post(endpoint)
 
 @app.route('/api/system/reboot', methods=['POST'])
 def trigger_reboot():
-    return jsonify(api_post("/system/reboot"))
+    return proxy_post("/system/reboot")
 
 @app.route('/api/system/shutdown', methods=['POST'])
 def trigger_shutdown():
-    return jsonify(api_post("/system/shutdown"))
+    return proxy_post("/system/shutdown")
 
 @app.route('/api/update/zip', methods=['POST'])
 def update_zip():
@@ -149,10 +190,12 @@ def update_zip():
     if file.filename == '':
         return jsonify({"error": "No selected file"}), 400
     
+    api_cache.clear()
     try:
         files = {'file': (file.filename, file.stream, file.mimetype)}
-        response = requests.post(f"{API_BASE_URL}/update/zip", files=files, timeout=30)
-        return jsonify(response.json())
+        response = api_session.post(f"{API_BASE_URL}/update/zip", files=files, timeout=30)
+        return Response(response.content, status=response.status_code,
+                        content_type=response.headers.get("Content-Type", "application/json"))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -169,7 +212,7 @@ def download_loxone_template(type):
         return "Invalid template type", 404
         
     try:
-        response = requests.get(f"{API_BASE_URL}{endpoints[type]}", timeout=10)
+        response = api_session.get(f"{API_BASE_URL}{endpoints[type]}", timeout=10)
         return response.text, 200, {
             'Content-Type': 'application/xml',
             'Content-Disposition': f'attachment; filename=loxio_{type}.xml'
@@ -180,15 +223,14 @@ def download_loxone_template(type):
 @app.route('/api/logs')
 def get_logs():
     try:
-        response = requests.get(f"{API_BASE_URL}/logs", timeout=10)
-        return jsonify(response.json())
+        body, status, content_type = fetch_raw("/logs")
+        return Response(body, status=status, content_type=content_type)
     except Exception as e:
         return jsonify({"logs": [f"Error fetching logs: {str(e)}"]})
 
 @app.route('/api/config/update', methods=['POST'])
 def update_config():
-    data = request.json
-    return jsonify(api_post("/config/update", data))
+    return proxy_post("/config/update", request.get_data())
 
 if __name__ == '__main__':
     debug_mode = os.environ.get("FLASK_DEBUG", "false").lower() in ("true", "1", "yes")